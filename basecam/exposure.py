@@ -274,6 +274,15 @@ class Exposure(object):
         return hdulist
 
 
+@functools.lru_cache(maxsize=None)
+def _get_num_regex(basename: str) -> re.Pattern:
+    """Returns a compiled regular expression that captures the sequence number."""
+
+    prefix, suffix = re.split(r"\{num.+\}", basename, maxsplit=1)
+
+    return re.compile(re.escape(prefix) + "(?P<num>[0-9]+)" + re.escape(suffix))
+
+
 class ImageNamer(object):
     """Creates a new sequential filename for an image.
 
@@ -299,6 +308,9 @@ class ImageNamer(object):
     reset_sequence
         Resets the sequence number when the directory changes (for example when
         the MJD rolls over).
+    observatory
+        The observatory used to calculate the ``sjd`` substitution in
+        ``dirname``. If `None`, the ``OBSERVATORY`` environment variable is used.
 
     Examples
     --------
@@ -316,6 +328,7 @@ class ImageNamer(object):
         overwrite: bool = False,
         camera: Optional[basecam.camera.BaseCamera] = None,
         reset_sequence: bool = True,
+        observatory: Optional[str] = None,
     ):
         assert re.match(r".+(\{num.+\}).+", basename), "invalid basename."
 
@@ -330,6 +343,8 @@ class ImageNamer(object):
         self._previous_dirname: str | None = None
         self._reset_sequence = reset_sequence
 
+        self.observatory = observatory
+
         self.camera = camera
 
     @property
@@ -347,7 +362,7 @@ class ImageNamer(object):
         """Returns the evaluated dirname."""
 
         date = astropy.time.Time.now()
-        sjd = get_sjd(raise_error=False)
+        sjd = get_sjd(self.observatory, raise_error=False)
 
         dirname = pathlib.Path(
             eval(
@@ -365,24 +380,28 @@ class ImageNamer(object):
 
         return dirname
 
-    def _get_num(self, basename: str) -> int:
+    def _get_num(self, basename: str, dirname: Optional[pathlib.Path] = None) -> int:
         """Returns the counter value."""
 
         if self.overwrite:
             return self._last_num + 1
 
-        regex = re.compile(re.sub(r"\{num.+\}", "(?P<num>[0-9]*?)", basename))
+        regex = _get_num_regex(basename)
 
-        dirname = self.get_dirname()
-        all_files = list(map(str, dirname.glob("*")))
+        dirname = dirname or self.get_dirname()
+        if not dirname.exists():
+            return self._last_num + 1
 
-        match_files = list(filter(regex.search, all_files))
+        values = []
+        with os.scandir(dirname) as entries:
+            for entry in entries:
+                match = regex.search(entry.name)
+                if match is not None:
+                    values.append(int(match.group("num")))
 
-        if len(match_files) == 0:
+        if len(values) == 0:
             return self._last_num + 1
 
-        matches = [regex.search(file) for file in match_files]
-        values = [int(match.group(1)) for match in matches if match is not None]
         return max(values) + 1
 
     def __call__(
@@ -399,7 +418,7 @@ class ImageNamer(object):
             expanded_basename = self.basename.format()
 
         dirname = self.get_dirname()
-        num = num or self._get_num(expanded_basename)
+        num = num or self._get_num(expanded_basename, dirname=dirname)
         path = dirname / expanded_basename.format(num=num)
 
         if update_num:
@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import abc
+import functools
 import re
 import warnings
 from collections.abc import Iterable
@@ -484,6 +485,14 @@ class MacroCard(object, metaclass=abc.ABCMeta):
         return header
 
 
+@functools.lru_cache(maxsize=None)
+def _get_default_wcs_cards() -> tuple:
+    """Returns the header cards for a default WCS as ``(keyword, value, comment)``."""
+
+    header = astropy.wcs.WCS().to_header()
+    return tuple((card.keyword, card.value, card.comment) for card in header.cards)
+
+
 class WCSCards(MacroCard):
     """A macro that adds WCS header information.
 
@@ -496,10 +505,8 @@ class WCSCards(MacroCard):
 
     def macro(self, exposure: Exposure, context: Dict[str, Any] = {}):
         if exposure.wcs is None:
-            wcs = astropy.wcs.WCS()
-        else:
-            wcs = exposure.wcs
-        return list(wcs.to_header().cards)
+            return list(_get_default_wcs_cards())
+        return list(exposure.wcs.to_header().cards)
 
 
 class DefaultCard(Card):
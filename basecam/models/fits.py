@@ -298,6 +298,44 @@ class HeaderModel(list):
     def insert(self, idx: int, card: _CardTypes):
         list.insert(self, idx, self._process_input(card))
 
+    def evaluate(
+        self,
+        exposure: Exposure,
+        context: Dict[str, Any] = {},
+    ) -> List[tuple]:
+        """Evaluates all the cards in the model without creating a header.
+
+        This is faster than `.to_header` when only the card values are needed.
+        Group titles are not included.
+
+        Parameters
+        ----------
+        exposure
+            The exposure for which we want to evaluate the model.
+        context
+            A dictionary of arguments used to evaluate the parameters in
+            the model.
+
+        Returns
+        -------
+        cards
+            A list of tuples with the format ``(keyword, value, comment)``
+            or ``(keyword, value)``, in the order in which they would appear
+            in the header.
+        """
+
+        cards = []
+
+        for card in self:
+            processed_card = self._process_input(card)
+            if processed_card is not None:
+                if isinstance(processed_card, Card):
+                    cards.append(processed_card.evaluate(exposure, context=context))
+                elif isinstance(processed_card, (CardGroup, MacroCard)):
+                    cards += processed_card.evaluate(exposure, context=context)
+
+        return cards
+
     def to_header(
         self,
         exposure: Exposure,
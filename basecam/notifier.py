@@ -107,19 +107,28 @@ class EventListener(asyncio.Queue):
         """Processes the queue and calls callbacks."""
 
         while True:
+            item = await self.get()
+
             try:
-                event, payload = await self.get()
+                event, payload = item
             except TypeError:
+                self.task_done()
                 continue
 
-            for callback in self.callbacks:
-                cb = callback(event, payload)
-                if asyncio.iscoroutine(cb):
-                    self.loop.create_task(cb)
+            try:
+                for callback in self.callbacks:
+                    cb = callback(event, payload)
+                    if asyncio.iscoroutine(cb):
+                        self.loop.create_task(cb)
+
+                if self._event_waiter:
+                    self.__events.add(event)
+                    self._event_waiter.set()
 
-            if self._event_waiter:
-                self.__events.add(event)
-                self._event_waiter.set()
+            finally:
+                # Allows to use join() to wait until all the events have been
+                # processed, even if a callback fails.
+                self.task_done()
 
     async def start_listening(self):
         """Starts the listener task. The queue will be initially purged."""
@@ -131,6 +140,7 @@ class EventListener(asyncio.Queue):
         while True:
             try:
                 self.get_nowait()
+                self.task_done()
             except asyncio.QueueEmpty:
                 break
 
@@ -156,7 +166,8 @@ class EventListener(asyncio.Queue):
             A function or coroutine function to be called. The callback
             receives the event (an enumeration value) as the first argument
             and the payload associated with that event as a dictionary.
-            If the callback is a coroutine, it is scheduled as a task.
+            If the callback is a coroutine, it is scheduled as a task. Note
+            that `.join` does not wait for those tasks to finish.
 
         """
 
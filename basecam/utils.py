@@ -66,6 +66,11 @@ class Poller(object):
         self._sleep_task = None
         self._task = None
 
+        # Set after each call to the callback and when the poller is stopped,
+        # respectively. Mostly useful to synchronise with the poller in tests.
+        self._tick_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
+
     async def poller(self):
         """The polling loop."""
 
@@ -79,6 +84,9 @@ class Poller(object):
                 self.loop.call_exception_handler(
                     {"message": "failed running callback", "exception": ee}
                 )
+
+            self._tick_event.set()
+
             self._sleep_task = self.loop.create_task(asyncio.sleep(self.delay))
 
             await self._sleep_task
@@ -126,6 +134,7 @@ class Poller(object):
         if self.running:
             return
 
+        self._stop_event.clear()
         self._task = self.loop.create_task(self.poller())
 
         return self
@@ -141,6 +150,8 @@ class Poller(object):
             with suppress(asyncio.CancelledError):
                 await self._task
 
+        self._stop_event.set()
+
     async def call_now(self):
         """Calls the callback immediately."""
 
@@ -7,9 +7,12 @@
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
 import asyncio
+import copy
+import functools
 import glob
 import os
 import tempfile
+from unittest.mock import AsyncMock
 
 import astropy.time
 import numpy
@@ -29,16 +32,105 @@ from basecam.utils import cancel_task
 
 TEST_CONFIG_FILE = os.path.dirname(__file__) + "/data/test_config.yaml"
 
-EXPOSURE_DIR = tempfile.TemporaryDirectory()
+# Parse the configuration file only once per session.
+TEST_CONFIG = read_yaml_file(TEST_CONFIG_FILE)
+
+# Use RAM-backed temporary directories, if available, to avoid hitting the disk
+# every time a test writes a FITS file.
+SHM_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+EXPOSURE_DIR = tempfile.TemporaryDirectory(dir=SHM_DIR)
+
+# The obstime of all the exposures taken with VirtualCamera.
+VIRTUAL_OBSTIME = astropy.time.Time("2000-01-01 00:00:00")
+
+
+def pytest_configure(config):
+    # Let pytest create its numbered, per-user temporary directories under
+    # /dev/shm instead of the system temporary directory.
+    if SHM_DIR:
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", SHM_DIR)
+
+
+def get_header_values(exposure):
+    """Returns a dictionary with the primary header values of an exposure.
+
+    Evaluates the header model directly instead of calling ``to_hdu()``.
+    """
+
+    header_model = exposure.fits_model[0].header_model
+    return {card[0]: card[1] for card in header_model.evaluate(exposure)}
+
+
+async def await_poller_tick(poller, n=1, timeout=1.0):
+    """Waits until a `.Poller` has called its callback ``n`` more times."""
+
+    for _ in range(n):
+        poller._tick_event.clear()
+        await asyncio.wait_for(poller._tick_event.wait(), timeout=timeout)
+
+
+def raise_error(error):
+    """Returns a coroutine function that raises ``error`` when awaited."""
+
+    async def _raise_error(*args, **kwargs):
+        raise error
+
+    return _raise_error
+
+
+@functools.lru_cache(maxsize=None)
+def get_spiral_image(height: int, width: int) -> numpy.ndarray:
+    """Returns a read-only image with a spiral pattern.
+
+    The image is cached so that it is only generated once for each shape.
+    """
+
+    # Creates a spiral pattern
+    xx = numpy.arange(-5, 5, 0.1)
+    yy = numpy.arange(-5, 5, 0.1)
+    xg, yg = numpy.meshgrid(xx, yy, sparse=True)
+    tile = numpy.sin(xg**2 + yg**2) / (xg**2 + yg**2)
+
+    # Repeats the tile to match the size of the image.
+    data = numpy.tile(
+        tile.astype(numpy.uint16),
+        (height // len(yy) + 1, width // len(yy) + 1),
+    )
+    data = data[0:height, 0:width]
+    data.flags.writeable = False
+
+    return data
 
 
 class CameraSystemTester(CameraSystem):
     _connected_cameras = []
     __version__ = "0.1.0"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Set every time a camera is added or removed so that tests can wait on it.
+        self.cameras_changed = asyncio.Event()
+
     def list_available_cameras(self):
         return self._connected_cameras
 
+    async def add_camera(self, *args, **kwargs):
+        camera = await super().add_camera(*args, **kwargs)
+        self.cameras_changed.set()
+        return camera
+
+    async def remove_camera(self, *args, **kwargs):
+        await super().remove_camera(*args, **kwargs)
+        self.cameras_changed.set()
+
+    async def wait_for_change(self, timeout: float = 1.0):
+        """Waits until a camera is added or removed."""
+
+        await asyncio.wait_for(self.cameras_changed.wait(), timeout=timeout)
+        self.cameras_changed.clear()
+
 
 class VirtualCamera(
     BaseCamera,
@@ -72,6 +164,15 @@ class VirtualCamera(
 
         self.data = False
 
+        # Spy on the shutter and post-process stages so that tests can check how
+        # they were awaited or make them fail by setting a side effect.
+        self._set_shutter_internal = AsyncMock(
+            wraps=functools.partial(VirtualCamera._set_shutter_internal, self)
+        )
+        self._post_process_internal = AsyncMock(
+            wraps=functools.partial(VirtualCamera._post_process_internal, self)
+        )
+
         super().__init__(*args, **kwargs)
 
         self.image_namer.dirname = EXPOSURE_DIR.name
@@ -104,27 +205,16 @@ class VirtualCamera(
         self.notify(CameraEvent.EXPOSURE_FLUSHING)
         self.notify(CameraEvent.EXPOSURE_INTEGRATING)
 
-        # Creates a spiral pattern
-        xx = numpy.arange(-5, 5, 0.1)
-        yy = numpy.arange(-5, 5, 0.1)
-        xg, yg = numpy.meshgrid(xx, yy, sparse=True)
-        tile = numpy.sin(xg**2 + yg**2) / (xg**2 + yg**2)
-
-        # Repeats the tile to match the size of the image.
-        data = numpy.tile(
-            tile.astype(numpy.uint16),
-            (self.height // len(yy) + 1, self.width // len(yy) + 1),
-        )
-        data = data[0 : self.height, 0 : self.width]
-
         # For some tests, we want to set out custom data.
         if self.data is not False:
             data = self.data
+        else:
+            data = get_spiral_image(self.height, self.width).copy()
 
         self.notify(CameraEvent.EXPOSURE_READING)
 
         exposure.data = data
-        exposure.obstime = astropy.time.Time("2000-01-01 00:00:00")
+        exposure.obstime = VIRTUAL_OBSTIME
 
         await self.set_shutter(False)
 
@@ -166,7 +256,7 @@ def clean_exposure_dir():
 
 @pytest.fixture(scope="module")
 def config():
-    return read_yaml_file(TEST_CONFIG_FILE)
+    return copy.deepcopy(TEST_CONFIG)
 
 
 @pytest.fixture(scope="module")
@@ -199,18 +289,29 @@ async def camera(camera_system):
     camera.camera_system.notifier.register_listener(listener)
     listener.register_callback(add_event)
 
+    camera.listener = listener
+
     yield camera
 
     await listener.stop_listening()
 
 
+@pytest.fixture
+def tiny_image(camera):
+    """Makes the camera return a 1x1 image.
+
+    For tests that only check the header or the camera state, not the pixels.
+    """
+
+    camera.data = numpy.zeros((1, 1), dtype=numpy.uint16)
+
+
 @pytest.fixture()
 async def actor_setup(config):
     """Setups an actor for testing, mocking the client transport.
 
-    This fixture has module scope. Usually you'll want to use it for a
-    function-scoped fixture in which you clear the mock replies after each
-    test.
+    Usually you'll want to use the ``actor`` fixture, which adds a camera and
+    clears the mock replies after each test.
 
     """
 
@@ -233,7 +334,7 @@ async def actor(actor_setup):
     # Clear replies in preparation for next test.
     actor_setup.mock_replies.clear()
 
-    for cam in actor_setup.camera_system.cameras:
+    for cam in actor_setup.camera_system.cameras.copy():
         actor_setup.camera_system.cameras.remove(cam)
 
     actor_setup.default_cameras = actor_setup._default_cameras
@@ -249,8 +350,8 @@ async def command(actor):
 def exposure(camera):
     exp = Exposure(camera)
 
+    # Exposure already sets obstime to the current time.
     exp.data = numpy.zeros((10, 10), dtype=numpy.uint16)
-    exp.obstime = astropy.time.Time.now()
     exp.image_type = "object"
     exp.exptime = 1.0
 
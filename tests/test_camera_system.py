@@ -11,7 +11,12 @@ import logging
 
 import pytest
 
-from .conftest import TEST_CONFIG_FILE, CameraSystemTester, VirtualCamera
+from .conftest import (
+    TEST_CONFIG_FILE,
+    CameraSystemTester,
+    VirtualCamera,
+    await_poller_tick,
+)
 
 
 pytestmark = pytest.mark.asyncio
@@ -25,41 +30,55 @@ async def test_load_config():
 
 
 async def test_discover(camera_system):
-    await camera_system.start_camera_poller(0.1)
+    await camera_system.start_camera_poller(0.01)
     camera_system._connected_cameras = ["DEV_12345"]
 
-    await asyncio.sleep(0.2)
+    await camera_system.wait_for_change()
 
     assert len(camera_system.cameras) == 1
     assert isinstance(camera_system.cameras[0], VirtualCamera)
 
     camera_system._connected_cameras = []
 
-    await asyncio.sleep(0.2)
+    await camera_system.wait_for_change()
 
     assert len(camera_system.cameras) == 0
 
 
-async def test_camera_connected(camera_system):
-    camera_system.on_camera_connected("DEV_12345")
+@pytest.mark.parametrize(
+    "attribute,uids",
+    [("exclude", ["DEV_12345"]), ("include", ["DEV_00000"])],
+)
+async def test_discover_ignored(camera_system, monkeypatch, attribute, uids):
+    monkeypatch.setattr(camera_system, attribute, uids)
 
-    await asyncio.sleep(0.1)
+    await camera_system.start_camera_poller(0.01)
+    camera_system._connected_cameras = ["DEV_12345"]
+
+    await await_poller_tick(camera_system._camera_poller, 2)
+
+    assert len(camera_system.cameras) == 0
+
+
+async def test_camera_connected(camera_system):
+    await camera_system.on_camera_connected("DEV_12345")
 
     assert len(camera_system.cameras) == 1
     assert isinstance(camera_system.cameras[0], VirtualCamera)
 
-    camera_system.on_camera_disconnected("DEV_12345")
-
-    await asyncio.sleep(0.1)
+    await camera_system.on_camera_disconnected("DEV_12345")
 
     assert len(camera_system.cameras) == 0
 
 
-async def test_get_cameras_not_implemented(camera_system, mocker):
-    camera_system.list_available_cameras = mocker.Mock(side_effect=NotImplementedError)
+async def test_get_cameras_not_implemented(camera_system, mocker, monkeypatch):
+    list_cameras = mocker.Mock(side_effect=NotImplementedError)
+    monkeypatch.setattr(camera_system, "list_available_cameras", list_cameras)
+
+    await camera_system.start_camera_poller(0.01)
 
-    await camera_system.start_camera_poller(0.1)
-    await asyncio.sleep(0.5)
+    poller = camera_system._camera_poller
+    await asyncio.wait_for(poller._stop_event.wait(), timeout=1)
 
     assert camera_system._camera_poller is not None
     assert camera_system._camera_poller.running is False
@@ -75,8 +94,8 @@ async def test_config_bad_uid(camera_system):
     assert data is None
 
 
-async def test_no_config(camera_system):
-    camera_system._config = None
+async def test_no_config(camera_system, monkeypatch):
+    monkeypatch.setattr(camera_system, "_config", None)
 
     data = camera_system.get_camera_config("test_camera")
     assert data is None
@@ -89,11 +108,12 @@ async def test_config_from_uid(camera_system):
     assert data["uid"] == "DEV_12345"
 
 
-@pytest.mark.parametrize("param,value", [("name", "test_camera"), ("uid", "DEV_12345")])
-async def test_add_camerera_already_connected(camera_system, caplog, param, value):
-    camera = await eval(f"camera_system.add_camera({param}={value!r})")
+@pytest.mark.parametrize("kwargs", [{"name": "test_camera"}, {"uid": "DEV_12345"}])
+async def test_add_camerera_already_connected(camera_system, caplog, kwargs):
+    camera = await camera_system.add_camera(**kwargs)
     assert camera
-    assert getattr(camera, param) == value
+    for param, value in kwargs.items():
+        assert getattr(camera, param) == value
 
     caplog.clear()
 
@@ -114,13 +134,17 @@ async def test_remove_camera_not_connected(camera_system):
 
 
 @pytest.mark.parametrize(
-    "params",
-    ['name="test_camera"', 'uid="DEV_12345"', 'name="test_camera", uid="DEV_12345"'],
+    "kwargs",
+    [
+        {"name": "test_camera"},
+        {"uid": "DEV_12345"},
+        {"name": "test_camera", "uid": "DEV_12345"},
+    ],
 )
-async def test_get_camera(camera_system, params):
+async def test_get_camera(camera_system, kwargs):
     await camera_system.add_camera(name="test_camera")
 
-    camera = eval(f"camera_system.get_camera({params})")
+    camera = camera_system.get_camera(**kwargs)
 
     assert camera.name == "test_camera"
     assert camera.uid == "DEV_12345"
@@ -78,10 +78,12 @@ def test_image_namer(tmp_path):
     assert image_namer._last_num == 1
 
 
-def test_image_namer_sjd(tmp_path, monkeypatch):
-    monkeypatch.setenv("OBSERVATORY", "APO")
-
-    image_namer = ImageNamer("test_{num:04d}.fits", dirname=str(tmp_path) + "/{sjd}")
+def test_image_namer_sjd(tmp_path):
+    image_namer = ImageNamer(
+        "test_{num:04d}.fits",
+        dirname=str(tmp_path) + "/{sjd}",
+        observatory="APO",
+    )
     sjd = get_sjd("APO")
 
     assert image_namer() == tmp_path / f"{sjd}/test_0001.fits"
@@ -107,6 +109,18 @@ def test_image_namer_files_exist(tmp_path):
     assert image_namer._last_num == 5
 
 
+def test_image_namer_new_files(tmp_path):
+    image_namer = ImageNamer("test_{num:04d}.fits", dirname=tmp_path)
+
+    assert image_namer() == tmp_path / "test_0001.fits"
+    assert image_namer() == tmp_path / "test_0002.fits"
+
+    # Files written by someone else are taken into account.
+    (tmp_path / "test_0007.fits").touch()
+
+    assert image_namer() == tmp_path / "test_0008.fits"
+
+
 @pytest.mark.asyncio
 async def test_image_name_non_existent_directory(exposure, tmp_path):
     test_filename = tmp_path / "test_dir/another_dir/test.fits"
@@ -7,89 +7,55 @@
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
 import asyncio
+from unittest.mock import call
 
 import pytest
 
 from basecam.events import CameraEvent
 
+from .conftest import get_header_values
 
-pytestmark = pytest.mark.asyncio
-
-
-async def test_bias(camera, mocker):
-    mock = mocker.patch.object(
-        camera,
-        "_set_shutter_internal",
-        wraps=camera._set_shutter_internal,
-    )
-
-    # Open the shutter
-    await camera.open_shutter()
-
-    exposure = await camera.bias()
-    hdu = exposure.to_hdu()
-
-    assert hdu[0].header["EXPTIME"] == 0.0
-    assert hdu[0].header["IMAGETYP"] == "bias"
-
-    calls = mock.mock_calls
-    assert len(calls) == 2
-    assert calls[1][1][0] is False
 
+pytestmark = pytest.mark.asyncio
 
-async def test_dark(camera, mocker):
-    mock = mocker.patch.object(
-        camera,
-        "_set_shutter_internal",
-        wraps=camera._set_shutter_internal,
-    )
-
-    exposure = await camera.dark(5)
-    hdu = exposure.to_hdu()
-
-    assert hdu[0].header["EXPTIME"] == 5
-    assert hdu[0].header["IMAGETYP"] == "dark"
-
-    calls = mock.mock_calls
-    assert len(calls) == 0
 
+_real_sleep = asyncio.sleep
 
-async def test_flat(camera, mocker):
-    mock = mocker.patch.object(
-        camera,
-        "_set_shutter_internal",
-        wraps=camera._set_shutter_internal,
-    )
 
-    exposure = await camera.flat(5)
-    hdu = exposure.to_hdu()
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Makes `asyncio.sleep` return in the next iteration of the event loop."""
 
-    assert hdu[0].header["EXPTIME"] == 5
-    assert hdu[0].header["IMAGETYP"] == "flat"
+    async def fast_sleep(delay, result=None):
+        return await _real_sleep(0, result)
 
-    calls = mock.mock_calls
-    assert len(calls) == 2
-    assert calls[0][1][0] is True
-    assert calls[1][1][0] is False
+    monkeypatch.setattr(asyncio, "sleep", fast_sleep)
 
 
-async def test_object(camera, mocker):
-    mock = mocker.patch.object(
-        camera,
-        "_set_shutter_internal",
-        wraps=camera._set_shutter_internal,
-    )
+@pytest.mark.usefixtures("tiny_image")
+@pytest.mark.parametrize(
+    "image_type,exptime,shutter_calls",
+    [
+        ("bias", 0.0, [call(True), call(False)]),
+        ("dark", 5, []),
+        ("flat", 5, [call(True), call(False)]),
+        ("object", 5, [call(True), call(False)]),
+    ],
+)
+async def test_image_type(camera, image_type, exptime, shutter_calls):
+    if image_type == "bias":
+        # Open the shutter to check that the bias closes it.
+        await camera.open_shutter()
+        exposure = await camera.bias()
+    else:
+        exposure = await getattr(camera, image_type)(exptime)
 
-    exposure = await camera.object(5)
-    hdu = exposure.to_hdu()
+    header = get_header_values(exposure)
 
-    assert hdu[0].header["EXPTIME"] == 5
-    assert hdu[0].header["IMAGETYP"] == "object"
+    assert header["EXPTIME"] == exptime
+    assert header["IMAGETYP"] == image_type
 
-    calls = mock.mock_calls
-    assert len(calls) == 2
-    assert calls[0][1][0] is True
-    assert calls[1][1][0] is False
+    assert camera._set_shutter_internal.await_args_list == shutter_calls
 
 
 async def test_shutter(camera):
@@ -106,6 +72,7 @@ async def test_get_temperature(camera):
     assert await camera.get_temperature() == camera.temperature
 
 
+@pytest.mark.usefixtures("no_sleep")
 async def test_set_temperature(camera):
     await camera.set_temperature(100.0)
 
@@ -117,13 +84,20 @@ async def test_set_temperature(camera):
 
 
 async def test_set_temperature_override(camera):
-    await camera.set_temperature(100.0)
+    task = asyncio.create_task(camera.set_temperature(100.0))
+    assert await camera.listener.wait_for(CameraEvent.NEW_SET_POINT, timeout=1)
 
-    await asyncio.sleep(0.01)
     await camera.set_temperature(0.0)
 
+    # The first set point is cancelled before it is reached.
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await asyncio.wait_for(camera.listener.join(), timeout=1)
+
     assert await camera.get_temperature() == 0.0
     assert CameraEvent.SET_POINT_REACHED in camera.events[-1]
+    assert camera.events[-1][1]["temperature"] == 0.0
 
 
 async def test_get_binning(camera):
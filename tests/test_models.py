@@ -28,6 +28,29 @@ class MacroCardTest(models.MacroCard):
         ]
 
 
+# Macros are not modified when evaluated so they can be shared between tests.
+MACRO_CARD = MacroCardTest(name="test_macro", use_group_title=False)
+MACRO_CARD_GROUP_TITLE = MacroCardTest(name="test_macro", use_group_title=True)
+
+TEST_DEFAULT_CARD = models.DefaultCard(
+    "TESTCARD",
+    value="2+2",
+    comment="",
+    evaluate=True,
+)
+
+
+def _add(x, y):
+    return x + y
+
+
+@pytest.fixture
+def basic_header_model():
+    """A copy of `.basic_header_model` to which tests can add cards."""
+
+    return HeaderModel(models.basic_header_model)
+
+
 def test_fits_model():
     fits_model = models.FITSModel()
 
@@ -119,9 +142,8 @@ def test_fits_model_multi_extension_compressed(exposure):
     assert hdulist[2].data is None
 
 
-def test_basic_header_model(exposure):
-    basic_header_model = models.basic_header_model
-    basic_header_model.append(MacroCardTest())
+def test_basic_header_model(exposure, basic_header_model):
+    basic_header_model.append(MACRO_CARD)
     basic_header_model.append(models.Card("TEST", "test"))
 
     header = basic_header_model.to_header(exposure)
@@ -130,8 +152,7 @@ def test_basic_header_model(exposure):
     assert "TEST" in header
 
 
-def test_header_model_insert(exposure):
-    basic_header_model = models.basic_header_model
+def test_header_model_insert(exposure, basic_header_model):
     basic_header_model.insert(0, Card("A", 1))
 
     header = basic_header_model.to_header(exposure)
@@ -139,15 +160,13 @@ def test_header_model_insert(exposure):
     assert header["A"] == 1
 
 
-def test_header_invalid_card():
+def test_header_invalid_card(basic_header_model):
     with pytest.raises(CardError):
-        basic_header_model = models.basic_header_model
         basic_header_model.insert(0, {})
 
 
-def test_header_describe(exposure):
-    basic_header_model = models.basic_header_model
-    basic_header_model.append(MacroCardTest())
+def test_header_describe(exposure, basic_header_model):
+    basic_header_model.append(MACRO_CARD)
     basic_header_model.append(
         models.CardGroup(
             [
@@ -168,7 +187,7 @@ def test_header_describe(exposure):
 
 
 def test_macro(exposure):
-    macro = MacroCardTest(name="test_macro", use_group_title=False)
+    macro = MACRO_CARD
 
     cards = macro.evaluate(exposure)
     assert isinstance(cards, list)
@@ -181,7 +200,7 @@ def test_macro(exposure):
 
 
 def test_macro_with_group_title(exposure):
-    macro = MacroCardTest(name="test_macro", use_group_title=True)
+    macro = MACRO_CARD_GROUP_TITLE
     header = macro.to_header(exposure)
 
     assert len(header) == 5
@@ -224,7 +243,7 @@ def test_card_group_insert(exposure):
 
 
 def test_evaluate_callable(exposure):
-    card = models.Card("testcall", value=lambda x, y: x + y, fargs=(1, 2))
+    card = models.Card("testcall", value=_add, fargs=(1, 2))
 
     name, value, comment = card.evaluate(exposure)
 
@@ -238,13 +257,8 @@ def test_card_evaluate(exposure):
     assert card.evaluate(exposure)[1] == 4
 
 
-def test_card_default_evaluate(exposure):
-    models.DEFAULT_CARDS["TESTCARD"] = models.DefaultCard(
-        "TESTCARD",
-        value="2+2",
-        comment="",
-        evaluate=True,
-    )
+def test_card_default_evaluate(exposure, monkeypatch):
+    monkeypatch.setitem(models.DEFAULT_CARDS, "TESTCARD", TEST_DEFAULT_CARD)
 
     card = models.Card("TESTCARD")
     assert card.evaluate(exposure)[1] == 4
@@ -359,6 +373,18 @@ def test_header_model_tuple(exposure):
     assert header["KEY2"] == 2
 
 
+def test_header_model_evaluate(exposure):
+    header_model = HeaderModel(
+        [Card("KEY1", 1), None, ("KEY2", 2), MacroCardTest(use_group_title=True)]
+    )
+    cards = header_model.evaluate(exposure)
+
+    assert isinstance(cards, list)
+    assert len(cards) == 6
+    assert cards[0] == ("KEY1", 1, "")
+    assert cards[2] == ("KEYWORD1", 1, "The first card")
+
+
 def test_header_bad_default_card(exposure):
     with pytest.raises(CardError) as err:
         HeaderModel([Card("KEY1", 1), "BADCARD"])
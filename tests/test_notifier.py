@@ -32,7 +32,7 @@ async def camera_system(camera_system, listener):
 
     camera_system.events = []
 
-    async def record_event(event, __):
+    def record_event(event, __):
         camera_system.events.append(event)
 
     listener.register_callback(record_event)
@@ -53,7 +53,7 @@ async def test_listener(camera_system, listener):
     events = camera_system.events
 
     await camera_system.add_camera("test_camera")
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(listener.join(), timeout=1)
 
     n_events = len(events)
     assert n_events > 0
@@ -66,7 +66,7 @@ async def test_listener(camera_system, listener):
     # Restart
     await listener.start_listening()
     await camera_system.add_camera("test_camera")
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(listener.join(), timeout=1)
 
     assert len(events) > n_events
 
@@ -77,11 +77,41 @@ async def test_callback_function(camera_system, listener, mocker):
     listener.register_callback(func_callback)
 
     await camera_system.add_camera("test_camera")
-    await asyncio.sleep(0.1)
+    await asyncio.wait_for(listener.join(), timeout=1)
 
     func_callback.assert_called()
 
 
+async def test_callback_coroutine(camera_system, listener, mocker):
+    coro_callback = mocker.AsyncMock()
+
+    listener.register_callback(coro_callback)
+
+    await camera_system.add_camera("test_camera")
+    await asyncio.wait_for(listener.join(), timeout=1)
+
+    # join() does not wait for the tasks that run coroutine callbacks.
+    await asyncio.sleep(0)
+
+    coro_callback.assert_awaited()
+
+
+async def test_listener_bad_item(listener, mocker):
+    func_callback = mocker.MagicMock()
+    listener.register_callback(func_callback)
+
+    listener.put_nowait(None)
+    await asyncio.wait_for(listener.join(), timeout=1)
+
+    func_callback.assert_not_called()
+
+    # The listener keeps processing events after a malformed item.
+    listener.put_nowait((CameraSystemEvent.CAMERA_ADDED, {}))
+    await asyncio.wait_for(listener.join(), timeout=1)
+
+    func_callback.assert_called_once_with(CameraSystemEvent.CAMERA_ADDED, {})
+
+
 async def test_remove_callback(camera_system, listener):
     assert len(listener.callbacks) == 1
     cb = listener.callbacks[0]
@@ -120,7 +150,7 @@ async def test_filter_notifications(camera_system, listener, event_loop):
     camera_system.notifier.remove_listener(listener)
     camera_system.notifier.register_listener(filtered_listener)
 
-    async def record_event(event, __):
+    def record_event(event, __):
         camera_system.events.append(event)
 
     filtered_listener.register_callback(record_event)
@@ -130,7 +160,7 @@ async def test_filter_notifications(camera_system, listener, event_loop):
     await camera_system.add_camera("test_camera")
     await camera_system.remove_camera("test_camera")
 
-    await asyncio.sleep(0.2)
+    await asyncio.wait_for(filtered_listener.join(), timeout=1)
 
     assert len(events) == 1
 